@@ -1,31 +1,54 @@
-from typing import List
+from array import array
+from typing import Callable, List, Tuple
 
 class Solution:
     def get_combination_sum(self, candidates:List[int], target:int)->List[List[int]]:
 
         all_combination = []
+        # copy only at the leaf, path keeps changing afterwards
+        self._search(candidates, target, lambda path: all_combination.append(path.copy()))
 
-        def dfs(index, current_combination, current_sum):
-            nonlocal all_combination
+        return all_combination
+
+    def get_combination_sum_flat(self, candidates:List[int], target:int)->Tuple[array, array]:
+        # Same search, but every combination is packed back to back into one
+        # int array, with a second array holding the length of each one.
+        # 4 bytes per value instead of one list (plus int objects) per result.
+        values = array('i')
+        lengths = array('i')
+
+        def emit(path):
+            values.extend(path)
+            lengths.append(len(path))
+
+        self._search(candidates, target, emit)
+        return values, lengths
+
+    def _search(self, candidates:List[int], target:int, emit:Callable[[List[int]], None])->None:
+        # sorted candidates let us stop a loop as soon as one candidate overshoots
+        candidates = sorted(candidates)
+        # single path reused by every branch: append before recursing, pop after
+        path = []
+
+        def dfs(start, current_sum):
             # fisrt check if it matches with target
             if current_sum==target:
-                all_combination.append(current_combination)
-                return
-
-            # check if it exceeds or out of candiate
-            if index>=len(candidates) or current_sum>7:
+                emit(path)
                 return
 
-            # check possibilities using current element
-            dfs(index, current_combination+[candidates[index]], current_sum+candidates[index])
-            # check with out current element
-            dfs(index+1, current_combination, current_sum)
+            for i in range(start, len(candidates)):
+                # every candidate after i is bigger, so none of them can fit either
+                if current_sum+candidates[i]>target:
+                    break
+                path.append(candidates[i])
+                # pass i (not i+1) because the same candidate can be reused
+                dfs(i, current_sum+candidates[i])
+                path.pop()
 
-        dfs(0, [], 0)
-
-        return all_combination
+        dfs(0, 0)
 
 if __name__ == "__main__":
 
     solution = Solution()
-    print(solution.get_combination_sum([2,3,6,7], 7))
\ No newline at end of file
+    print(solution.get_combination_sum([2,3,6,7], 7))
+    print(solution.get_combination_sum_flat([2,3,6,7], 7))
@@ -1,29 +1,51 @@
 from typing import List
 class Solution:
     def exist(self, board: List[List[str]], word: str) -> bool:
-        
-        def dfs(i, j, k):
-            if k==len(word):
-                return True
-            if i<0 or i>=len(board) or j<0  or j>=len(board[0]) or board[i][j]!=word[k]:
-                return False
+        rows, cols = len(board), len(board[0])
+        # flatten the board row-major: cell (i, j) lives at index i*cols+j
+        cells = [ch for row in board for ch in row]
+        size = len(cells)
+        last = len(word)-1
 
-            temp, board[i][j] = board[i][j], '/'
-            result = dfs(i+1, j, k+1) or dfs(i-1, j, k+1) or dfs(i,j+1, k+1 ) or dfs(i, j-1, k+1)
+        def dfs(start):
+            # explicit stack of (pos, k) instead of recursion.
+            # (pos, ~k) is a "restore" entry: it is popped once every path
+            # through pos has been explored and puts word[k] back in the cell.
+            stack = [(start, 0)]
+            while stack:
+                pos, k = stack.pop()
+                if k<0:
+                    cells[pos] = word[~k]
+                    continue
+                if cells[pos]!=word[k]:
+                    continue
+                if k==last:
+                    return True
 
-            board[i][j] = temp
-            return result
+                # mark visited with a char that can never match
+                cells[pos] = '/'
+                stack.append((pos, ~k))
+                # push in reverse so neighbours are tried down, up, right, left
+                col = pos % cols
+                if col>0:
+                    stack.append((pos-1, k+1))
+                if col+1<cols:
+                    stack.append((pos+1, k+1))
+                if pos>=cols:
+                    stack.append((pos-cols, k+1))
+                if pos+cols<size:
+                    stack.append((pos+cols, k+1))
+            return False
 
         # First find the first char in board
-        for i in range(len(board)):
-            for j in range(len(board[0])):
-                if board[i][j] == word[0]:
-                    # call dfs to find the possibility
-                    if dfs(i, j, 0):
-                        return True
+        for pos in range(rows*cols):
+            if cells[pos] == word[0]:
+                # call dfs to find the possibility
+                if dfs(pos):
+                    return True
         return False
         
 if __name__ == "__main__":
 
     solution = Solution()
-    print(solution.exist([["A","B","C","E"],["S","F","C","S"],["A","D","E","E"]], "ABCCED"))
\ No newline at end of file
+    print(solution.exist([["A","B","C","E"],["S","F","C","S"],["A","D","E","E"]], "ABCCED"))
@@ -1,13 +1,21 @@
+from typing import List
+
 class Solution:
     def countBits(self, n: int) -> List[int]:
+        # Python 3.10+: int.bit_count is a single C call (hardware popcount)
+        if hasattr(int, "bit_count"):
+            return list(map(int.bit_count, range(n+1)))
+
         result = [0]*(n+1)
-        if n==0:
-            return result
-        result[1]=1
-        for i in range(2, n+1):
-            if i%2 == 0:
-                result[i]=result[i//2]
-            else:
-                # result[i]= result[i-1]+1
-                result[i]= result[i//2]+1
+        # bits(i) = bits(i >> 1) + lowest bit of i, no even/odd branch needed
+        for i in range(1, n+1):
+            result[i] = result[i >> 1] + (i & 1)
+        return result
+
+    def countBitsBytes(self, n: int) -> bytearray:
+        # a popcount is at most 64, so every count fits in one byte:
+        # 1 byte per entry instead of a full int object per list slot
+        result = bytearray(n+1)
+        for i in range(1, n+1):
+            result[i] = result[i >> 1] + (i & 1)
         return result
@@ -1,8 +1,8 @@
+from typing import List
+
 class Solution:
     def missingNumber(self, nums: List[int]) -> int:
-        xor=0
         n = len(nums)
-        for i in range(n):
-            xor = xor^i^nums[i]
-        xor = xor^n
-        return xor
\ No newline at end of file
+        # 0..n sums to n*(n+1)//2; whatever is left after removing sum(nums)
+        # is the missing number. sum() runs as a C loop over the list.
+        return n*(n+1)//2 - sum(nums)
@@ -1,4 +1,27 @@
-from typing import List
+from bisect import bisect_left
+from typing import List, Tuple
+
+def eytzinger(nums:List[int])->Tuple[List[int], List[int]]:
+    # Lay a sorted list out in BFS (Eytzinger) order: node k has children 2k and 2k+1.
+    # Slot 0 is unused. The second list maps each slot back to its index in nums.
+    n = len(nums)
+    values = [0]*(n+1)
+    indexes = [-1]*(n+1)
+    i = 0
+
+    def fill(k):
+        nonlocal i
+        # an in-order walk of the implicit tree visits slots in sorted order
+        if k<=n:
+            fill(2*k)
+            values[k] = nums[i]
+            indexes[k] = i
+            i += 1
+            fill(2*k+1)
+
+    fill(1)
+    return values, indexes
+
 class Solution:
     def binarySearch(self, nums:List[int], target:int)->int:
         n = len(nums)
@@ -15,7 +38,36 @@ class Solution:
                 left = mid+1
         return -1
 
+    def binarySearchBatch(self, nums:List[int], targets:List[int])->List[int]:
+        # bisect_left runs the binary search in C, so each lookup skips the Python loop
+        n = len(nums)
+        result = []
+        for target in targets:
+            idx = bisect_left(nums, target)
+            result.append(idx if idx<n and nums[idx]==target else -1)
+        return result
+
+    def eytzingerSearch(self, layout:Tuple[List[int], List[int]], target:int)->int:
+        values, indexes = layout
+        n = len(values)-1
+        k = 1
+        # no if/else on the comparison: go left (2k) or right (2k+1) by adding the bool
+        while k<=n:
+            k = 2*k + (values[k]<target)
+        # drop the trailing 1-bits (right turns) plus one more bit to get the lower bound slot
+        k >>= ((~k) & (k+1)).bit_length()
+        if k and values[k]==target:
+            return indexes[k]
+        return -1
+
+    def eytzingerSearchBatch(self, layout:Tuple[List[int], List[int]], targets:List[int])->List[int]:
+        # build the layout once with eytzinger() and reuse it for every lookup
+        return [self.eytzingerSearch(layout, target) for target in targets]
+
 if __name__ == "__main__":
     solution = Solution()
     print(solution.binarySearch([-1,0,3,5,9,12], 12))
-
+    print(solution.binarySearchBatch([-1,0,3,5,9,12], [-1, 2, 9]))
+    layout = eytzinger([-1,0,3,5,9,12])
+    print(solution.eytzingerSearch(layout, 12))
+    print(solution.eytzingerSearchBatch(layout, [-1, 2, 9]))
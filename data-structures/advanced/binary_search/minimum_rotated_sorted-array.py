@@ -5,8 +5,12 @@ class Solution:
         left  = 0
         right = n-1
         while left<right:
+            right_val = nums[right]
+            # the window is no longer rotated, its first element is the minimum
+            if nums[left] < right_val:
+                break
             mid = left+(right-left)//2
-            if nums[mid] > nums[right]:
+            if nums[mid] > right_val:
                 left = mid+1
             else:
                 right = mid
@@ -15,4 +19,4 @@ class Solution:
 
 if __name__ == "__main__":
     solution = Solution()
-    print(solution.getMinimum([3,4,5,1,2]))
\ No newline at end of file
+    print(solution.getMinimum([3,4,5,1,2]))
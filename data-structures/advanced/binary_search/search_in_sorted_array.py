@@ -8,20 +8,23 @@ class Solution:
 
         while left<=right:
             mid = left+(right-left)//2
+            # read each element once per iteration instead of re-indexing the list
+            mid_val = nums[mid]
 
-            if nums[mid]==target:
+            if mid_val==target:
                 return mid
 
             # check if left part is sorted
-            if nums[left]<=nums[mid]:
+            left_val = nums[left]
+            if left_val<=mid_val:
                 # check if target exist in first part
-                if nums[left]<=target<nums[mid]:
+                if left_val<=target<mid_val:
                     right = mid-1
                 else:
                     left = mid+1
             else:
                 #  check if target exist in right part
-                if nums[mid]<target <= nums[right]:
+                if mid_val<target <= nums[right]:
                     left = mid+1
                 else:
                     right = mid-1
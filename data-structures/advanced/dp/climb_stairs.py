@@ -1,23 +1,27 @@
+def fib_fast_doubling(n):
+    # returns (F(n), F(n+1)) in O(log n) multiplications using
+    #   F(2k)   = F(k) * (2*F(k+1) - F(k))
+    #   F(2k+1) = F(k)^2 + F(k+1)^2
+    # same helper as in fibonacci.py, copied so this file runs on its own
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a*(2*b-a)
+        d = a*a+b*b
+        if bit=='1':
+            a, b = d, c+d
+        else:
+            a, b = c, d
+    return a, b
+
 class Solution(object):
     def climbStairs(self, n):
         if n==1:
             return n
-        steps = [1, 2]
-
-        ways =  [float('inf')]*(n+1)
-        ways[0] = 0
-        ways[1] = 1
-        ways[2] = 2
-
-        for i in range(3, n+1):
-            ways[i] = ways[i-1] + ways[i-2]
-
-        if ways[n]==float('inf'):
-            return -1
-        return ways[n]
+        # ways(n) = ways(n-1) + ways(n-2) with ways(1)=1, ways(2)=2, i.e. F(n+1)
+        return fib_fast_doubling(n+1)[0]
 
 
 if __name__ == "__main__":
 
     solution = Solution()
-    print(solution.climbStairs(3))
\ No newline at end of file
+    print(solution.climbStairs(3))
@@ -1,20 +1,60 @@
 class Solution:
     def coinChange(self, coins, amount):
+        # amount+1 is larger than any valid answer, so it works as an int "infinity"
+        unreachable = amount+1
 
-        steps = [float('inf')]*(amount+1)
+        steps = [unreachable]*(amount+1)
 
         steps[0]=0
 
-        for i in range(1, amount+1):
-            for coin in coins:
-                if coin<=i:
-                    steps[i] = min(steps[i], steps[i-coin]+1)
-        if steps[amount] == float('inf'):
+        # coin outer, amount inner: each coin is one forward sweep over steps.
+        # Going left to right lets steps[i-coin] already include this coin,
+        # which is what allows a coin to be used any number of times.
+        for coin in set(coins):
+            for i in range(coin, amount+1):
+                candidate = steps[i-coin]+1
+                if candidate < steps[i]:
+                    steps[i] = candidate
+        if steps[amount] == unreachable:
             return -1
 
         return steps[amount]
 
+    def coinChangeMemo(self, coins, amount):
+        # top-down: only the remainders actually reachable from amount are solved.
+        # Coins <= 0 can never bring a remainder closer to 0, so they are dropped
+        # (a 0 coin would otherwise revisit the same remainder forever).
+        coins = sorted({coin for coin in coins if coin>0}, reverse=True)
+        unreachable = amount+1
+
+        # memo[rem] = fewest coins for rem. An explicit stack replaces recursion,
+        # so large amounts (e.g. [1], 10**4) cannot hit the recursion limit.
+        memo = {0: 0}
+        stack = [amount]
+        while stack:
+            rem = stack[-1]
+            if rem in memo:
+                stack.pop()
+                continue
+
+            # solve every unsolved sub-remainder first, then come back to rem
+            pending = [rem-coin for coin in coins if coin<=rem and rem-coin not in memo]
+            if pending:
+                stack.extend(pending)
+                continue
+
+            best = unreachable
+            for coin in coins:
+                if coin<=rem:
+                    best = min(best, memo[rem-coin]+1)
+            memo[rem] = best
+            stack.pop()
+
+        result = memo[amount]
+        return -1 if result>=unreachable else result
+
 if __name__ == "__main__":
 
     solution = Solution()
-    print(solution.coinChange([1,2,5], 11))
\ No newline at end of file
+    print(solution.coinChange([1,2,5], 11))
+    print(solution.coinChangeMemo([1,2,5], 11))
@@ -1,19 +1,26 @@
+def fib_fast_doubling(n):
+    # returns (F(n), F(n+1)) in O(log n) multiplications using
+    #   F(2k)   = F(k) * (2*F(k+1) - F(k))
+    #   F(2k+1) = F(k)^2 + F(k+1)^2
+    # walking the bits of n from the most significant one down
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a*(2*b-a)
+        d = a*a+b*b
+        if bit=='1':
+            a, b = d, c+d
+        else:
+            a, b = c, d
+    return a, b
+
 class Solution:
     def calculateFibonacci(self, n):
         if n<=1:
             return n
 
-        dp = [0]*(n+1)
-
-        dp[0]=0
-        dp[1]=1
-
-        for i in range(2, n+1):
-            dp[i] = dp[i-1]+dp[i-2]
-
-        return dp[n]
+        return fib_fast_doubling(n)[0]
 
 if __name__ == "__main__":
 
     solution = Solution()
-    print(solution.calculateFibonacci(8))
\ No newline at end of file
+    print(solution.calculateFibonacci(8))
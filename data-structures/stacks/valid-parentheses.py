@@ -1,20 +1,20 @@
+# opens become 1..3 and their closers become opener+3 (4..6); built once at import.
+# translate leaves unmapped characters alone, so real input code points 1..6 are sent
+# to 7 (a non-bracket) and only real brackets can land in 1..6
+_CODES = str.maketrans({"(": 1, "[": 2, "{": 3, ")": 4, "]": 5, "}": 6, **{chr(i): 7 for i in range(1, 7)}})
+
 class Solution:
     def isValid(self, s:str)->bool:
         stack = []
 
-        # bracket map
-        bracketMap = {")":"(", "}":"{", "]":"["}
-        #  loop over input
-        for character in s:
-            #  chekcking for close bracket (if character is closed bracket)
-            #  for close bracket we need to pop from stack if matching open bracket is present
-            if character in bracketMap:
-                if stack and stack[-1]==bracketMap[character]:
-                    stack.pop()
-                else:
-                    return False
-            else:
-                stack.append(character)
+        #  translate runs over the whole string in C, then the loop works on small ints
+        for code in map(ord, s.translate(_CODES)):
+            #  for an open bracket we push the code of the close bracket we now expect,
+            #  so a close bracket only has to equal the top of the stack
+            if code<=3:
+                stack.append(code+3)
+            elif not stack or stack.pop()!=code:
+                return False
         # if stack is empty .. we have valid input
         return not stack
 
@@ -1,41 +1,156 @@
+from array import array
+from collections import deque
+from itertools import islice
+from operator import lt
+from typing import List
+
 # Definition for a binary tree node.
-class TreeNode(object):
+class TreeNode:
+    # fixed attribute slots instead of a per-node __dict__
+    __slots__ = ('val', 'left', 'right')
+
     def __init__(self, val=0, left=None, right=None):
         self.val = val
         self.left = left
         self.right = right
 
+# The same tree stored as parallel arrays (structure of arrays).
+# Node i has value val[i] and children left[i] / right[i], given as indexes
+# into the same arrays (-1 for no child). Index 0 is the root.
+# Walking contiguous arrays avoids chasing pointers to scattered TreeNode objects.
+class ArrayTree:
+    __slots__ = ('val', 'left', 'right')
+
+    def __init__(self, val, left, right):
+        self.val = val
+        self.left = left
+        self.right = right
+
+    def __len__(self):
+        return len(self.val)
+
+    @classmethod
+    def from_nodes(cls, root):
+        val, left, right = array('q'), array('i'), array('i')
+        if not root:
+            return cls(val, left, right)
+
+        # number nodes in BFS order; a child gets the next free index
+        queue = deque([root])
+        val.append(root.val)
+        while queue:
+            node = queue.popleft()
+            for child, links in ((node.left, left), (node.right, right)):
+                if child:
+                    links.append(len(val))
+                    val.append(child.val)
+                    queue.append(child)
+                else:
+                    links.append(-1)
+        return cls(val, left, right)
+
+    def to_nodes(self):
+        if not self.val:
+            return None
+        nodes = [TreeNode(v) for v in self.val]
+        for i, node in enumerate(nodes):
+            if self.left[i] >= 0:
+                node.left = nodes[self.left[i]]
+            if self.right[i] >= 0:
+                node.right = nodes[self.right[i]]
+        return nodes[0]
+
+# Helpers over the ArrayTree arrays. They only use integer indexing and
+# fixed-size stacks sized once up front, so nothing is allocated per node.
+def _max_depth(left, right):
+    n = len(left)
+    if n == 0:
+        return 0
+    # a DFS stack never holds more than n entries
+    stack = [0] * n
+    depth = [0] * n
+    depth[0] = 1
+    top = 1
+    best = 0
+    while top:
+        top -= 1
+        i = stack[top]
+        d = depth[top]
+        if d > best:
+            best = d
+        if right[i] >= 0:
+            stack[top] = right[i]
+            depth[top] = d + 1
+            top += 1
+        if left[i] >= 0:
+            stack[top] = left[i]
+            depth[top] = d + 1
+            top += 1
+    return best
+
+def _inorder_fill(val, left, right, out):
+    # writes the inorder values into out and returns how many were written
+    n = len(val)
+    if n == 0:
+        return 0
+    stack = [0] * n
+    top = 0
+    count = 0
+    i = 0
+    while top or i >= 0:
+        while i >= 0:
+            stack[top] = i
+            top += 1
+            i = left[i]
+        top -= 1
+        i = stack[top]
+        out[count] = val[i]
+        count += 1
+        i = right[i]
+    return count
+
+# Free function so each recursive call is a plain global-name call,
+# without looking up and binding self.maxDepthRecursion every time.
+def _max_depth_recursion(root):
+    if not root:
+        return 0
+
+    left = _max_depth_recursion(root.left)
+    right = _max_depth_recursion(root.right)
+
+    return 1+ max(left, right)
+
 class Solution:
     def invertBinaryTree(self, root):
         if not root:
             return None
-        
-        root.left, root.right = root.right, root.left
-        self.invertBinaryTree(root.left)
-        self.invertBinaryTree(root.right)
+
+        # swap children level by level instead of recursing into each subtree
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            node.left, node.right = node.right, node.left
+            if node.left:
+                queue.append(node.left)
+            if node.right:
+                queue.append(node.right)
         return root
     
     def maxDepthRecursion(self, root:TreeNode)->int:
-        if not root:
-            return 0
-
-        left = self.maxDepthRecursion(root.left)
-        right = self.maxDepthRecursion(root.right)
-
-        return 1+ max(left, right)
+        return _max_depth_recursion(root)
     
     def maxDepthBFS(self, root:TreeNode)->int:
         if not root:
             return 0
         depth = 0
-        queue = [root]
+        queue = deque([root])
 
         while queue:
             depth +=1
             level_size = len(queue)
 
             for i in range(len(queue)):
-                node = queue.pop(0) #dequeu from the front
+                node = queue.popleft() #dequeu from the front
                 if node.left:
                     queue.append(node.left)
                 if node.right:
@@ -47,31 +162,51 @@ class Solution:
         if not root:
             return 0
         max_depth = 0
-        stack = [(root, 1)]
+        # two stacks that grow and shrink together, so no (node, depth)
+        # tuple is allocated per push
+        nodes = [root]
+        depths = [1]
+
+        while nodes:
+            node = nodes.pop()
+            depth = depths.pop()
+
+            if depth > max_depth:
+                max_depth = depth
+            if node.left:
+                nodes.append(node.left)
+                depths.append(depth+1)
+            if node.right:
+                nodes.append(node.right)
+                depths.append(depth+1)
+        return max_depth
 
-        while stack:
-            node, depth = stack.pop()
 
-            if node:
-                max_depth = max(max_depth, depth)
-                if node.left:
-                    stack.append((node.left, depth+1))
-                if node.right:
-                    stack.append((node.right, depth+1))
-        return max_depth
+    def maxDepthArray(self, tree:ArrayTree)->int:
+        # same as maxDepthDFS but on an ArrayTree, following child indexes
+        return _max_depth(tree.left, tree.right)
+
+    def inorderArray(self, tree:ArrayTree)->List[int]:
+        out = array('q', bytes(8*len(tree)))
+        _inorder_fill(tree.val, tree.left, tree.right, out)
+        return out.tolist()
 
 
     def isSameTree(self, p:TreeNode, q:TreeNode)->bool:
-        if not p and not q:
-            return True
+        # compare both trees pair by pair using an explicit stack
+        stack = [(p, q)]
+        while stack:
+            p, q = stack.pop()
+            if not p and not q:
+                continue
 
-        if not p or not q or p.val!=q.val:
-            return False
+            if not p or not q or p.val!=q.val:
+                return False
 
-        left = self.isSameTree(p.left, q.left)
-        right = self.isSameTree(p.right, q.right)
+            stack.append((p.right, q.right))
+            stack.append((p.left, q.left))
 
-        return left and right
+        return True
 
     def isSubTree(self, root:TreeNode, subRoot:TreeNode)->bool:
         if subRoot is None:
@@ -79,13 +214,37 @@ class Solution:
         if root == None and subRoot!=None:
             return False
 
-        if self.isSameTree(root, subRoot):
-            return True
-        
-        left = self.isSubTree(root.left, subRoot)
-        right = self.isSubTree(root.right, subRoot)
-
-        return left or right
+        # Give every distinct subtree shape of root an id in one pass, then
+        # look subRoot up in the same table: O(n + m) instead of calling
+        # isSameTree at every node of root.
+        ids = {}
+        self._subtree_id(root, ids, add=True)
+        return self._subtree_id(subRoot, ids, add=False) is not None
+
+    def _subtree_id(self, root, ids, add):
+        # Iterative post-order. A subtree is keyed by (val, left id, right id)
+        # and two subtrees get the same id only if they are identical, so
+        # there are no hash collisions to double check. The empty tree is 0.
+        # With add=False unknown keys are not inserted and None is returned.
+        node_id = {None: 0}
+        stack = [(root, False)]
+        while stack:
+            node, visited = stack.pop()
+            if not node:
+                continue
+            if not visited:
+                stack.append((node, True))
+                stack.append((node.right, False))
+                stack.append((node.left, False))
+                continue
+
+            key = (node.val, node_id[node.left], node_id[node.right])
+            if key not in ids:
+                if not add:
+                    return None
+                ids[key] = len(ids)+1
+            node_id[node] = ids[key]
+        return node_id[root]
 
     def find_lca_bst(self, root, p, q):
         #  We need to use the bst property ... in bst all the nodes in left side are lesser than root
@@ -108,99 +267,117 @@ class Solution:
             return []
 
         result = []
-        queue = [root]
+        queue = deque([root])
 
-        while root:
+        while queue:
             level_size=len(queue)
             level = []
 
             for _ in range(level_size):
-                node = queue.pop(0)
+                node = queue.popleft()
                 level.append(node.val)
 
                 if node.left:
                     queue.append(node.left)
                 if node.right:
                     queue.append(node.right)
-            resule.append(level)
+            result.append(level)
         return result
 
     def inorder(self, root, to_list):
-        if not root:
-            return
-        if root.left:
-            self.inorder(root.left, to_list)
-        to_list.append(root.val)
-
-        if root.right:
-            self.inorder(root.right, to_list)
+        stack = []
+        node = root
+        while stack or node:
+            # go as far left as possible, remembering the path
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            to_list.append(node.val)
+            node = node.right
 
         
     def validateBinarySearchTree(self, root):
-        #  get the inorder traversal
-        #  if sorted it is valid
+        #  walk the tree inorder; in a bst every value is bigger than the previous one
+        #  stop at the first value that breaks the order
         if not root:
             return False
 
-        to_list = []
-        self.inorder(root, to_list)
-
-        is_bst = True
-
-        prev = to_list[0]
-        for i in range(1, len(to_list)):
-            if to_list[i]<=prev:
-                is_bst = False
-            prev = to_list[i]
-
-        return is_bst
-
-    def kthSmallestInBST(self, root):
-        if not root:
+        stack = []
+        node = root
+        prev = float('-inf')
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            if node.val<=prev:
+                return False
+            prev = node.val
+            node = node.right
+
+        return True
+
+    def validateBinarySearchTreeArray(self, tree:ArrayTree):
+        # same check as validateBinarySearchTree on an ArrayTree: fill the inorder
+        # values with the _inorder_fill helper, then compare neighbours pairwise
+        # with map(lt, ...), which runs the whole comparison loop in C
+        if not len(tree):
             return False
 
-        to_list = []
-        self.inorder(root, to_list)
+        out = array('q', bytes(8*len(tree)))
+        _inorder_fill(tree.val, tree.left, tree.right, out)
+        return all(map(lt, out, islice(out, 1, None)))
 
-        is_bst = True
+    def kthSmallestInBST(self, root, k):
+        # inorder visits a bst in sorted order, so the k-th pop (1-based) is the answer
+        if not root:
+            return None
 
-        prev = to_list[0]
-        for i in range(1, len(to_list)):
-            if to_list[i]<=prev:
-                is_bst = False
-            prev = to_list[i]
-        if is_bst:
-            return to_list[k+1]
+        stack = []
+        node = root
+        prev = float('-inf')
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            if node.val<=prev:
+                # not a bst
+                return None
+            k -= 1
+            if k==0:
+                return node.val
+            prev = node.val
+            node = node.right
 
         return None
 
     def buildTree(self, preorder: List[int], inorder: List[int]) -> TreeNode:
-        # Create a map to efficiently find the index of any element in inorder list
-        io_map = {}
-        for i in range(len(inorder)):
-            io_map[inorder[i]] = i
-
-        # Call recursive helper function to build the tree
-        return self.splitTree(preorder, io_map, 0, 0, len(inorder) - 1)
-
-    def splitTree(self, preorder, io_map, rootIndex, left, right):
-        # Base case: if the left index exceeds the right index, subtree is empty
-        if left > right:
+        if not preorder:
             return None
 
-        # Create the root node with the current root element
-        root = TreeNode(preorder[rootIndex])
-
-        # Find the index of the root element in inorder list
-        mid = io_map[preorder[rootIndex]]
-
-        # Recursively build the left subtree
-        if mid > left:
-            root.left = self.splitTree(preorder, io_map, rootIndex + 1, left, mid - 1)
-
-        # Recursively build the right subtree
-        if mid < right:
-            root.right = self.splitTree(preorder, io_map, rootIndex + mid - left + 1, mid + 1, right)
+        # Walk preorder once. The stack holds the current path of nodes still
+        # waiting for a right child; inorder_idx points at the next node that
+        # inorder visits, which tells us when a left chain has ended.
+        root = TreeNode(preorder[0])
+        stack = [root]
+        inorder_idx = 0
+
+        for i in range(1, len(preorder)):
+            node = stack[-1]
+            if node.val != inorder[inorder_idx]:
+                # top of the stack is not finished yet, so this value is its left child
+                node.left = TreeNode(preorder[i])
+                stack.append(node.left)
+            else:
+                # pop every node inorder has already reached; the last one popped
+                # is the parent whose right child this value is
+                while stack and stack[-1].val == inorder[inorder_idx]:
+                    node = stack.pop()
+                    inorder_idx += 1
+                node.right = TreeNode(preorder[i])
+                stack.append(node.right)
 
         return root
 
@@ -212,20 +389,28 @@ class Solution:
         """
         max_sum = float('-inf')
 
-        def dfs(node):
-            nonlocal max_sum  # Required to modify outer scope variable
+        # iterative post-order: a node is processed (visited=True) only after
+        # both children, and its best downward path is kept in gains
+        gains = {None: 0}
+        stack = [(root, False)]
+        while stack:
+            node, visited = stack.pop()
             if not node:
-                return 0
-            
-            left_gain = max(dfs(node.left), 0)
-            right_gain = max(dfs(node.right), 0)
+                continue
+            if not visited:
+                stack.append((node, True))
+                stack.append((node.right, False))
+                stack.append((node.left, False))
+                continue
+
+            left_gain = max(gains[node.left], 0)
+            right_gain = max(gains[node.right], 0)
 
             price_new_path = left_gain+right_gain+node.val
             max_sum = max(max_sum, price_new_path)
 
-            return node.val + max(left_gain, right_gain)
+            gains[node] = node.val + max(left_gain, right_gain)
 
-        dfs(root)
         return max_sum
         
     def serialize(self, root):
@@ -236,18 +421,21 @@ class Solution:
         """
         if not root:
             return ""
-        result, queue = [], [root]
+        # preorder with an explicit stack, written into one growing buffer
+        buf, stack = bytearray(), [root]
 
-        while queue:
-            node = queue.pop(0)
+        while stack:
+            node = stack.pop()
             if node:
-                result.append(str(node.val))
-                queue.append(node.left)
-                queue.append(node.right)
+                buf += str(node.val).encode()
+                buf += b','
+                # push right first so the left subtree is written first
+                stack.append(node.right)
+                stack.append(node.left)
             else:
-                result.append('N')
+                buf += b'N,'
 
-        return ",".join(result)
+        return buf[:-1].decode()
 
         
 
@@ -261,19 +449,21 @@ class Solution:
             return None
         values = data.split(',')
         root = TreeNode(int(values[0]))
-        queue = [root]
-        i =1
-        while queue:
-            node = queue.pop(0)
-
-            if values[i] != 'N':
-                node.left = TreeNode(int(values[i]))
-                queue.append(node.left)
-            i +=1
-            if values[i] != 'N':
-                node.right = TreeNode(int(values[i]))
-                queue.append(node.right)
-            i +=1
+        # (node, side) entries: the next preorder value is node's left child
+        # when side is 0 and its right child when side is 1
+        stack = [(root, 0)]
+        for i in range(1, len(values)):
+            node, side = stack.pop()
+            child = None if values[i] == 'N' else TreeNode(int(values[i]))
+
+            if side == 0:
+                node.left = child
+                # the right child comes after the whole left subtree
+                stack.append((node, 1))
+            else:
+                node.right = child
+            if child:
+                stack.append((child, 0))
         return root
 
 
@@ -302,5 +492,7 @@ if __name__ == "__main__":
     print(solution.maxDepthRecursion(node1))
     print(solution.maxDepthBFS(node1))
     print(solution.maxDepthDFS(node1))
+    print(solution.maxDepthArray(ArrayTree.from_nodes(node1)))
+    print(solution.inorderArray(ArrayTree.from_nodes(node1)))
     print(solution.isSameTree(node1, node1))
     print(solution.isSubTree(node1, node2))
\ No newline at end of file
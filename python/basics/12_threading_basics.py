@@ -48,17 +48,25 @@ def basic_thread_example() -> None:
 counter = 0
 counter_lock = threading.Lock()
 
+# How many increments are applied per lock acquisition.
+INCREMENT_CHUNK = 1024
+
 
 def increment(n: int) -> None:
     """
     Increment a shared counter n times in a thread-safe way.
     Using a Lock prevents race conditions.
+
+    Taking the lock costs far more than `counter += 1`, so instead of locking
+    once per increment we add a whole chunk per lock. The threads still
+    take turns on the counter, but with ~1000x fewer lock operations.
     """
     global counter
-    for _ in range(n):
+    for start in range(0, n, INCREMENT_CHUNK):
+        step = min(INCREMENT_CHUNK, n - start)
         # Critical section: only one thread can execute this block at a time.
         with counter_lock:
-            counter += 1
+            counter += step
 
 
 def shared_data_example() -> None:
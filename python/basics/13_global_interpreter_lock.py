@@ -37,12 +37,27 @@ Below are small examples to illustrate GIL effects.
 
 import threading
 import time
+from multiprocessing import Pool
+from typing import Optional
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the nogil demo is skipped without it
+    njit = None
 
 
 def cpu_bound_work(n: int) -> int:
+    """
+    Sum of squares 0^2 + 1^2 + ... + (n-1)^2 using the closed form.
+    This is the fast path; it does O(1) work, so it is no use for the demos.
+    """
+    return (n - 1) * n * (2 * n - 1) // 6
+
+
+def cpu_bound_work_loop(n: int) -> int:
     """
     A naive CPU-bound function: sum of squares.
-    Used to simulate heavy computation in pure Python.
+    Used to simulate heavy computation in pure Python for the GIL demos.
     """
     total = 0
     for i in range(n):
@@ -54,9 +69,9 @@ def single_thread_cpu_demo() -> None:
     """
     Run CPU-bound work in a single thread.
     """
-    start = time.time()
-    cpu_bound_work(50_000_00)  # adjust this if it runs too fast/slow
-    end = time.time()
+    start = time.perf_counter()
+    cpu_bound_work_loop(50_000_00)  # adjust this if it runs too fast/slow
+    end = time.perf_counter()
     print(f"Single thread CPU demo took: {end - start:.3f} seconds")
 
 
@@ -67,24 +82,106 @@ def multi_thread_cpu_demo() -> None:
     Because of the GIL, this will often NOT be significantly faster than the
     single-thread version for pure Python CPU-bound code.
     """
-    start = time.time()
+    start = time.perf_counter()
 
-    t1 = threading.Thread(target=cpu_bound_work, args=(50_000_00,))
-    t2 = threading.Thread(target=cpu_bound_work, args=(50_000_00,))
+    t1 = threading.Thread(target=cpu_bound_work_loop, args=(50_000_00,))
+    t2 = threading.Thread(target=cpu_bound_work_loop, args=(50_000_00,))
 
     t1.start()
     t2.start()
     t1.join()
     t2.join()
 
-    end = time.time()
+    end = time.perf_counter()
     print(f"Two threads CPU demo took: {end - start:.3f} seconds")
 
 
-def io_bound_work(delay: float) -> None:
+def multi_process_cpu_demo() -> None:
+    """
+    Run the same CPU-bound work in two processes instead of two threads.
+
+    Each process has its own interpreter and its own GIL, so on a machine with
+    at least two cores this should take roughly half the two-thread time.
+    """
+    start = time.perf_counter()
+
+    with Pool(2) as pool:
+        pool.map(cpu_bound_work_loop, [50_000_00, 50_000_00])
+
+    end = time.perf_counter()
+    print(f"Two processes CPU demo took: {end - start:.3f} seconds")
+
+
+def cpu_bound_work_float(n: int) -> float:
+    """
+    Sum of squares accumulated in a float, used only by the nogil demo.
+
+    Its result is a floating-point approximation and is NOT comparable to
+    cpu_bound_work / cpu_bound_work_loop. The float accumulator is on purpose:
+    an integer total would overflow int64 once compiled, and the compiler can
+    replace an integer sum-of-squares loop with a closed form, leaving no work
+    to time. Float additions cannot be reordered (no fastmath), so the
+    compiled loop really runs all n steps one after another.
+    """
+    total = 0.0
+    for i in range(n):
+        x = float(i)
+        total += x * x
+    return total
+
+
+# Compiled code is much faster than the pure-Python loop, so the nogil demo
+# needs a bigger n for its timings to be measurable.
+NOGIL_WORK_N = 200_000_000
+
+if njit is not None:
+    # cpu_bound_work_float compiled to native code. nogil=True releases the GIL
+    # while it runs, so two threads calling it can really use two cores.
+    cpu_bound_work_nogil = njit(nogil=True, cache=True)(cpu_bound_work_float)
+
+
+def multi_thread_nogil_cpu_demo() -> None:
+    """
+    Run the Numba-compiled CPU-bound work once, then in two threads.
+
+    Unlike multi_thread_cpu_demo, the compiled function releases the GIL, so
+    on a machine with at least two cores the two-thread run should take about
+    as long as the single run instead of twice as long. Requires numba.
+    """
+    if njit is None:
+        print("Two threads nogil CPU demo skipped: numba is not installed")
+        return
+
+    # Warm-up call so JIT compilation time is not part of the measurement.
+    cpu_bound_work_nogil(1)
+
+    start = time.perf_counter()
+    cpu_bound_work_nogil(NOGIL_WORK_N)
+    end = time.perf_counter()
+    print(f"Single thread nogil CPU demo took: {end - start:.3f} seconds")
+
+    start = time.perf_counter()
+
+    t1 = threading.Thread(target=cpu_bound_work_nogil, args=(NOGIL_WORK_N,))
+    t2 = threading.Thread(target=cpu_bound_work_nogil, args=(NOGIL_WORK_N,))
+
+    t1.start()
+    t2.start()
+    t1.join()
+    t2.join()
+
+    end = time.perf_counter()
+    print(f"Two threads nogil CPU demo took: {end - start:.3f} seconds")
+
+
+def io_bound_work(delay: float, barrier: Optional[threading.Barrier] = None) -> None:
     """
     A simple I/O-bound function: just sleeps to simulate I/O wait.
+    If a barrier is given, wait on it first so every thread starts sleeping
+    at the same moment.
     """
+    if barrier is not None:
+        barrier.wait()
     time.sleep(delay)
 
 
@@ -94,18 +191,26 @@ def multi_thread_io_demo() -> None:
 
     Two threads both sleeping should take roughly the max of their delays,
     not the sum, because they can overlap while waiting.
+
+    The threads are created and started before the timer, then all three
+    (two workers + main) meet at a Barrier. Starting the timer at the barrier
+    keeps thread creation/start-up cost out of the measurement.
     """
-    start = time.time()
+    barrier = threading.Barrier(3)
 
-    t1 = threading.Thread(target=io_bound_work, args=(2,))
-    t2 = threading.Thread(target=io_bound_work, args=(2,))
+    t1 = threading.Thread(target=io_bound_work, args=(2, barrier))
+    t2 = threading.Thread(target=io_bound_work, args=(2, barrier))
 
     t1.start()
     t2.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+
     t1.join()
     t2.join()
 
-    end = time.time()
+    end = time.perf_counter()
     print(f"Two threads I/O demo took: {end - start:.3f} seconds")
 
 
@@ -113,6 +218,8 @@ if __name__ == "__main__":
     print("=== Global Interpreter Lock (GIL) demos ===")
     single_thread_cpu_demo()
     multi_thread_cpu_demo()
+    multi_process_cpu_demo()
+    multi_thread_nogil_cpu_demo()
     multi_thread_io_demo()
 
 
@@ -48,19 +48,29 @@ class Enemy:
     # In this example codebase, Zombie and Ogre inherit from Enemy, use `super().__init__()` to properly initialize their base parts,
     # and access their own instance properties and methods using `self`.
 
+    # __slots__ gives each instance fixed attribute storage instead of a __dict__.
+    # Private names listed here are name-mangled like any other (_Enemy__type_of_enemy).
+    __slots__ = ('__type_of_enemy', 'health_points', 'attack_damage', '_msg_talk', '_msg_walk')
+
     def __init__(self, type_of_enemy, health_points, attack_damage):
         self.__type_of_enemy = type_of_enemy
         self.health_points = health_points
         self.attack_damage = attack_damage
+        # these messages only depend on the type, which never changes, so build them once.
+        # attack() still formats its message because attack_damage can be changed later.
+        self._msg_talk = f"I am a {type_of_enemy}. Be prepared to fight!"
+        self._msg_walk = f"{type_of_enemy} moves closer to you"
 
     def talk(self):
-        print(f"I am a {self.__type_of_enemy}. Be prepared to fight!")
+        print(self._msg_talk)
 
     def walk_forward(self):
-        print(f"{self.__type_of_enemy} moves closer to you")
+        print(self._msg_walk)
 
     def attack(self):
         print(f"{self.__type_of_enemy} attacks for {self.attack_damage} damage")  
 
-    def get_type_of_enemy(self):
+    # read-only property: enemy.type_of_enemy reads the private value, but cannot set it
+    @property
+    def type_of_enemy(self):
         return self.__type_of_enemy
\ No newline at end of file
@@ -3,7 +3,7 @@ from Ogre import *
 
 zombie = Zombie(10, 1)
 
-print(f'{zombie.get_type_of_enemy()} has {zombie.health_points} health points and can do attack of {zombie.attack_damage}')
+print(f'{zombie.type_of_enemy} has {zombie.health_points} health points and can do attack of {zombie.attack_damage}')
 
 zombie.talk()
 zombie.walk_forward()
@@ -11,6 +11,6 @@ zombie.attack()
 zombie.spread_disease()
 
 ogre = Ogre(20, 3)
-print(f'{ogre.get_type_of_enemy()} has {ogre.health_points} health points and can do attack of {ogre.attack_damage}')
+print(f'{ogre.type_of_enemy} has {ogre.health_points} health points and can do attack of {ogre.attack_damage}')
 
 ogre.talk()
\ No newline at end of file
@@ -14,19 +14,29 @@ class Enemy:
     # Even though 'battle' expects an Enemy, if you pass a Zombie or Ogre, Python will call the overridden 'talk' method, 
     # demonstrating polymorphism in action.
 
+    # __slots__ gives each instance fixed attribute storage instead of a __dict__.
+    # Private names listed here are name-mangled like any other (_Enemy__type_of_enemy).
+    __slots__ = ('__type_of_enemy', 'health_points', 'attack_damage', '_msg_walk')
+
     def __init__(self, type_of_enemy, health_points, attack_damage):
         self.__type_of_enemy = type_of_enemy
         self.health_points = health_points
         self.attack_damage = attack_damage
+        # the walk message only depends on the type, which never changes, so build it once.
+        # talk() is overridden by Zombie and Ogre, so its message is formatted on call instead
+        # of being stored on every instance; attack() too, since attack_damage can change.
+        self._msg_walk = f"{type_of_enemy} moves closer to you"
 
     def talk(self):
         print(f"I am a {self.__type_of_enemy}. Be prepared to fight!")
 
     def walk_forward(self):
-        print(f"{self.__type_of_enemy} moves closer to you")
+        print(self._msg_walk)
 
     def attack(self):
         print(f"{self.__type_of_enemy} attacks for {self.attack_damage} damage")  
 
-    def get_type_of_enemy(self):
+    # read-only property: enemy.type_of_enemy reads the private value, but cannot set it
+    @property
+    def type_of_enemy(self):
         return self.__type_of_enemy
\ No newline at end of file
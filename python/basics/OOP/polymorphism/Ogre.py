@@ -1,8 +1,12 @@
 from Enemy import *
 
 class Ogre(Enemy):
+    # no new attributes, but an empty __slots__ keeps instances free of a __dict__
+    __slots__ = ()
+
     def __init__(self, health_points, attack_damage):
-        super().__init__(type_of_enemy="Ogre", health_points=health_points, attack_damage=attack_damage)
+        # direct call to the base initializer with positional args; the chain is single inheritance
+        Enemy.__init__(self, "Ogre", health_points, attack_damage)
 
     def talk(self):
         print("Ogre is slamming hands all around!")
\ No newline at end of file
@@ -25,4 +25,6 @@ def upgrade() -> None:
 
 def downgrade() -> None:
     """Downgrade schema."""
-    op.drop_column('users', 'phone_number_2')
+    # SQLite before 3.35 has no DROP COLUMN; on SQLite batch mode drops it by copying the table
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('phone_number_2')
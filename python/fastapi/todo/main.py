@@ -1,14 +1,28 @@
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from database import engine
 import models
 from routers import auth, todos, admin, user
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # create_all issues a CREATE TABLE check for every model, so it runs once
+    # when the server starts instead of whenever main.py is imported (e.g. by
+    # tests or scripts). Deployments whose schema is managed by alembic can set
+    # AUTO_CREATE_TABLES=0 to skip it; it stays on by default because the
+    # migrations do not create the base tables.
+    if os.environ.get("AUTO_CREATE_TABLES", "1") == "1":
+        models.Base.metadata.create_all(bind=engine)
+    yield
 
-models.Base.metadata.create_all(bind=engine)
+app = FastAPI(lifespan=lifespan)
 
+# no I/O here, so async def runs it directly on the event loop;
+# a plain def would be dispatched to the threadpool on every call
 @app.get('/healthy')
-def health_check():
+async def health_check():
     return {'status':'Healthy'}
     
 app.include_router(auth.router)
@@ -23,6 +23,8 @@ def get_db():
 
 db_dependency = Annotated[Session, Depends(get_db)]
 user_dependency = Annotated[dict, Depends(get_current_user)]
+# built once and shared by every route that takes a todo id
+todo_id_path = Annotated[int, Path(gt=0)]
 
 
 @router.get("/todo", status_code=status.HTTP_200_OK)
@@ -33,11 +35,11 @@ async def read_all(user: user_dependency, db: db_dependency):
 
 
 @router.delete("/todo/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_todo(user: user_dependency, db: db_dependency, todo_id: int = Path(gt=0)):
+async def delete_todo(user: user_dependency, db: db_dependency, todo_id: todo_id_path):
     if user is None or user.get('user_role') != 'admin':
         raise HTTPException(status_code=401, detail='Authentication Failed')
     todo_model = db.query(Todos).filter(Todos.id == todo_id).first()
     if todo_model is None:
         raise HTTPException(status_code=404, detail='Todo not found.')
-    db.query(Todos).filter(Todos.id == todo_id).delete()
+    db.delete(todo_model)
     db.commit()
\ No newline at end of file
@@ -16,6 +16,7 @@ router = APIRouter(
 
 SECRET_KEY = '2c0b7c2efdc45ed0000d9cd0d68aecab07a98310f5351d79ec2de8b3ebb13aab'
 ALGORITHM = 'HS256'
+ACCESS_TOKEN_EXPIRES = timedelta(minutes=20)
 
 bcrypt_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
 oauth2_bearer = OAuth2PasswordBearer(tokenUrl = '/auth/token')
@@ -94,7 +95,7 @@ async def login_for_access_token(form_data: Annotated[OAuth2PasswordRequestForm,
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Could not validate credentials')
 
     
-    token = create_access_token(user.username, user.id, user.role, timedelta(minutes=20))
+    token = create_access_token(user.username, user.id, user.role, ACCESS_TOKEN_EXPIRES)
     # return token
     return {'access_token': token, 'token_type': 'bearer'}
 
@@ -1,6 +1,6 @@
-from typing import Annotated
+from typing import Annotated, List
 from sqlalchemy.orm import Session
-from fastapi import APIRouter, Depends, HTTPException, Path, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, status
 from models import Todos
 from database import SessionLocal
 from pydantic import BaseModel, Field
@@ -21,6 +21,11 @@ def get_db():
 
 db_dependency = Annotated[Session, Depends(get_db)]
 user_dependency = Annotated[dict, Depends(get_current_user)]
+# built once and shared by every route that takes a todo id
+todo_id_path = Annotated[int, Path(gt=0)]
+
+# upper bound on how many todos one bulk request may create
+MAX_BULK_TODOS = 100
 class TodoRequest(BaseModel):
     title:str = Field(min_length=3)
     description:str = Field(min_length=3, max_length=100)
@@ -35,7 +40,7 @@ async def read_all(user:user_dependency, db:db_dependency):
     return db.query(Todos).filter(Todos.owner_id == user.get('id')).all()
 
 @router.get("/{todo_id}", status_code=status.HTTP_200_OK)
-async def read_todo(user:user_dependency, db:db_dependency, todo_id:int=Path(gt=0)):
+async def read_todo(user:user_dependency, db:db_dependency, todo_id:todo_id_path):
     if user is None:
         raise HTTPException(status_code=401, detail='Authentication Failed')
     todo_model = db.query(Todos).filter(Todos.id==todo_id).filter(Todos.owner_id == user.get('id')).first()
@@ -50,13 +55,22 @@ async def create_todo(user:user_dependency, db:db_dependency, todo_request:TodoR
 
     if user is None:
         raise HTTPException(status_code=401, detail='Authentication Failed')
-    todo_model = Todos(**todo_request.dict(), owner_id=user.get('id'))
+    todo_model = Todos(**todo_request.model_dump(), owner_id=user.get('id'))
 
     db.add(todo_model)
     db.commit()
 
+@router.post("/bulk", status_code=status.HTTP_201_CREATED)
+async def create_todos(user:user_dependency, db:db_dependency, todo_requests:Annotated[List[TodoRequest], Body(max_length=MAX_BULK_TODOS)]):
+    # create many todos in one request and one transaction instead of one POST per todo
+    if user is None:
+        raise HTTPException(status_code=401, detail='Authentication Failed')
+    owner_id = user.get('id')
+    db.add_all([Todos(**todo_request.model_dump(), owner_id=owner_id) for todo_request in todo_requests])
+    db.commit()
+
 @router.put("/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def update_todo(user:user_dependency, db:db_dependency, todo_request:TodoRequest, todo_id:int=Path(gt=0)):
+async def update_todo(user:user_dependency, db:db_dependency, todo_request:TodoRequest, todo_id:todo_id_path):
     if user is None:
         raise HTTPException(status_code=401, detail='Authentication Failed')
     todo_model = db.query(Todos).filter(Todos.id==todo_id).filter(Todos.owner_id == user.get('id')).first()
@@ -68,11 +82,11 @@ async def update_todo(user:user_dependency, db:db_dependency, todo_request:TodoR
     todo_model.priority = todo_request.priority
     todo_model.complete = todo_request.complete
 
-    db.add(todo_model)
+    # todo_model came from this session, so the changes are flushed on commit without db.add
     db.commit()
 
 @router.delete("/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_todo(user:user_dependency, db:db_dependency, todo_id:int=Path(gt=0)):
+async def delete_todo(user:user_dependency, db:db_dependency, todo_id:todo_id_path):
     if user is None:
         raise HTTPException(status_code=401, detail='Authentication Failed')
 
@@ -80,5 +94,6 @@ async def delete_todo(user:user_dependency, db:db_dependency, todo_id:int=Path(g
 
     if todo_model is None:
         raise HTTPException(status_code=404, detail='Todo not found.')
-    db.query(Todos).filter(Todos.id==todo_id).filter(Todos.owner_id == user.get('id')).delete()
+    # the row is already loaded, delete it directly instead of querying for it again
+    db.delete(todo_model)
     db.commit()
@@ -0,0 +1,87 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from ..main import app, models, todos
+
+# one shared in-memory database for the whole test module
+engine = create_engine(
+    'sqlite://',
+    connect_args={'check_same_thread': False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+models.Base.metadata.create_all(bind=engine)
+
+
+def override_get_db():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def override_get_current_user():
+    return {'username': 'testuser', 'id': 1, 'user_role': 'admin'}
+
+
+app.dependency_overrides[todos.get_db] = override_get_db
+app.dependency_overrides[todos.get_current_user] = override_get_current_user
+
+client = TestClient(app)
+
+
+def valid_todo(i):
+    return {'title': f'Todo {i}', 'description': 'Bulk created todo', 'priority': 3, 'complete': False}
+
+
+def count_todos():
+    db = TestingSessionLocal()
+    try:
+        return db.query(models.Todos).filter(models.Todos.owner_id == 1).count()
+    finally:
+        db.close()
+
+
+@pytest.fixture(autouse=True)
+def clean_todos():
+    yield
+    db = TestingSessionLocal()
+    db.query(models.Todos).delete()
+    db.commit()
+    db.close()
+
+
+def test_create_todos_bulk():
+    response = client.post('/todo/bulk', json=[valid_todo(i) for i in range(3)])
+    assert response.status_code == status.HTTP_201_CREATED
+    assert count_todos() == 3
+
+    db = TestingSessionLocal()
+    titles = sorted(todo.title for todo in db.query(models.Todos).all())
+    db.close()
+    assert titles == ['Todo 0', 'Todo 1', 'Todo 2']
+
+
+def test_create_todos_bulk_empty_list():
+    response = client.post('/todo/bulk', json=[])
+    assert response.status_code == status.HTTP_201_CREATED
+    assert count_todos() == 0
+
+
+def test_create_todos_bulk_invalid_item_commits_nothing():
+    invalid = valid_todo(1)
+    invalid['priority'] = 10
+    response = client.post('/todo/bulk', json=[valid_todo(0), invalid])
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert count_todos() == 0
+
+
+def test_create_todos_bulk_too_many():
+    response = client.post('/todo/bulk', json=[valid_todo(i) for i in range(todos.MAX_BULK_TODOS + 1)])
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert count_todos() == 0